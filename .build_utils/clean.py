@@ -1,22 +1,101 @@
 #!/usr/bin/env nix-shell
-#! nix-shell -i python3 -p python3
+#! nix-shell -i python3 -p python3 git
 
 """
 Cleans all subdirectories with no errors, language agnostic.
+Finds build artifact directories at any depth inside each node, deletes
+them concurrently and reports the space reclaimed per node.
 """
 
+import argparse
+import os
 import shutil
+import subprocess
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from os import listdir
 from os.path import isdir
 from pathlib import Path
 
+ARTIFACT_DIRS = ["target", "debug", ".venv", "dist"]
 
-def safe_rmtree(path):
-    """Safely remove directory tree."""
+# Never descended into while looking for artifacts
+SKIP_DIRS = {".git", ".direnv", "node_modules"}
+
+
+def dir_size(path) -> int:
+    """Disk usage of a directory tree in bytes (symlinks are not followed)."""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            st = entry.stat(follow_symlinks=False)
+                            total += getattr(st, "st_blocks", 0) * 512 or st.st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+    return total
+
+
+def human_size(size: float) -> str:
+    for unit in ["B", "KiB", "MiB", "GiB"]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TiB"
+
+
+def tracked_dirs() -> set[str]:
+    """Directories containing git-tracked files; these are never deleted."""
+    try:
+        files = subprocess.check_output(
+            ["git", "ls-files", "-z"], text=True, stderr=subprocess.DEVNULL
+        ).split("\0")
+    except (OSError, subprocess.CalledProcessError):
+        return set()
+
+    dirs = set()
+    for f in files:
+        dirs.update(str(p) for p in Path(f).parents)
+    return dirs
+
+
+def find_artifacts(node: str, names: set[str], protected: set[str]) -> list[str]:
+    """
+    Artifact directories anywhere below node. No artifact directory is
+    descended into, selected or not: a kept .venv may well contain packages
+    with their own dist/ or debug/ subdirectories.
+    """
+    found = []
+    for root, dirs, _ in os.walk(node):
+        keep = []
+        for d in dirs:
+            path = os.path.join(root, d)
+            if d in ARTIFACT_DIRS and os.path.normpath(path) not in protected:
+                if d in names:
+                    found.append(path)
+            elif d not in SKIP_DIRS and not os.path.islink(path):
+                keep.append(d)
+        dirs[:] = keep
+    return found
+
+
+def safe_rmtree(path) -> int:
+    """Safely remove directory tree, returning the bytes reclaimed."""
     try:
         if Path(path).exists():
+            size = dir_size(path)
             shutil.rmtree(path)
             # print(f"✓ Removed {path}")
+            return size
         else:
             pass
             # print(f"Directory {path} doesn't exist")
@@ -24,12 +103,62 @@ def safe_rmtree(path):
         print(f"✗ Permission denied: {path}")
     except Exception as e:
         print(f"✗ Error removing {path}: {e}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Remove build artifacts from nodes")
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=ARTIFACT_DIRS,
+        metavar="DIR",
+        help=f"Only remove these artifact dirs (default: {' '.join(ARTIFACT_DIRS)})",
+    )
+    parser.add_argument(
+        "--keep",
+        nargs="+",
+        default=[],
+        choices=ARTIFACT_DIRS,
+        metavar="DIR",
+        help="Artifact dirs to keep, e.g. --keep .venv",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=min(8, os.cpu_count() or 1)
+    )
+    parser.add_argument(
+        "-n", "--dry-run", action="store_true", help="Only report what would be removed"
+    )
+
+    args = parser.parse_args()
+    names = set(args.only or ARTIFACT_DIRS) - set(args.keep)
+
+    start = time.perf_counter()
+    protected = tracked_dirs()
+    nodes = [d for d in listdir() if isdir(d) and d not in SKIP_DIRS]
+
+    artifacts = []
+    for node in nodes:
+        artifacts += [(node, path) for path in find_artifacts(node, names, protected)]
+    found = time.perf_counter()
+
+    remove = dir_size if args.dry_run else safe_rmtree
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        sizes = pool.map(remove, [path for _, path in artifacts])
+
+        per_node = defaultdict(int)
+        for (node, path), size in zip(artifacts, sizes):
+            per_node[node] += size
+    done = time.perf_counter()
+
+    verb = "would reclaim" if args.dry_run else "reclaimed"
+    for node, size in sorted(per_node.items(), key=lambda kv: -kv[1]):
+        print(f"  {node:<24} {human_size(size):>12}")
+    print(
+        f"{len(artifacts)} artifact dirs, {verb} {human_size(sum(per_node.values()))} "
+        f"(scan {found - start:.2f}s, remove {done - found:.2f}s)"
+    )
 
 
 if __name__ == "__main__":
-    for dir in listdir():
-        if isdir(dir):
-            safe_rmtree(dir + "/target")
-            safe_rmtree(dir + "/debug")
-            safe_rmtree(dir + "/.venv")
-            safe_rmtree(dir + "/dist")
+    main()
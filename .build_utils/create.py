@@ -12,10 +12,46 @@ import os
 import shutil
 import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 TEMPLATES_DIRECTORY = ".build_utils/templates"
 
+# Bytes read when sniffing whether a file is binary
+SNIFF_BYTES = 8192
+
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Very common items you almost always want to skip
+DEFAULT_BLACKLIST = {
+    ".git",
+    "node_modules",
+    "venv",
+    ".venv",
+    "__pycache__",
+    "*.pyc",
+    "dist",
+    "build",
+    ".pytest_cache",
+    ".coverage",
+    ".mypy_cache",
+    ".ruff_cache",
+    ".idea",
+    ".vscode",
+    ".DS_Store",
+    "*.lock",
+}
+
+# Makes uv, cargo and go resolve dependencies from their local caches only.
+# init.sh is run with these first; `--prewarm` fills the caches.
+OFFLINE_ENV = {
+    "UV_OFFLINE": "1",
+    "CARGO_NET_OFFLINE": "true",
+    "GOPROXY": "off",
+}
+
 
 DEBUG = False
 
@@ -37,42 +73,146 @@ def rename_content(content: str, old_name: str, new_name: str) -> str:
     return content
 
 
+def is_binary(data: bytes) -> bool:
+    """Sniff for binary content: a NUL byte in the first block means binary"""
+    return b"\0" in data[:SNIFF_BYTES]
+
+
+def copy_and_rename_file(src: Path, dst: Path, old_name: str, new_name: str):
+    """Copy a single file, rewriting its content if it is text"""
+    try:
+        data = src.read_bytes()
+    except OSError:
+        # Can't read it → just copy it as-is
+        shutil.copy2(src, dst)
+        return
+
+    if not is_binary(data):
+        try:
+            content = data.decode("utf-8")
+        except UnicodeDecodeError:
+            content = None
+
+        if content is not None:
+            new_content = rename_content(content, old_name, new_name)
+            if new_content != content:
+                dst.write_text(new_content, encoding="utf-8")
+                shutil.copystat(src, dst)
+                dprint(f"     ↳ content updated: {dst.name}")
+                return
+
+    shutil.copy2(src, dst)
+
+
 def copy_and_rename_tree(
     src_dir: Path, dst_dir: Path, old_name: str, new_name: str, blacklist: set[str]
 ):
     """
-    Recursively copy directory tree while renaming paths and contents
+    Copy directory tree while renaming paths and contents.
+    Directories are created up front, then files are copied concurrently.
     """
-    # Create destination directory if it doesn't exist
-    dst_dir.mkdir(parents=True, exist_ok=True)
-
-    for item in src_dir.iterdir():
-        # Skip blacklisted items (relative to template root)
-        rel_path = item.relative_to(src_dir)
-        if str(rel_path) in blacklist or rel_path.name in blacklist:
-            dprint(f"  Skipping blacklisted: {rel_path}")
-            continue
+    jobs: list[tuple[Path, Path]] = []
+
+    for root, dirs, files in os.walk(src_dir):
+        root_path = Path(root)
+        rel_root = root_path.relative_to(src_dir)
+        dst_root = dst_dir / Path(str(rel_root).replace(old_name, new_name))
+        dst_root.mkdir(parents=True, exist_ok=True)
+
+        # Skip blacklisted items (relative to template root); pruning `dirs`
+        # in place stops os.walk from descending into them
+        def allowed(name: str) -> bool:
+            rel_path = rel_root / name
+            if str(rel_path) in blacklist or name in blacklist:
+                dprint(f"  Skipping blacklisted: {rel_path}")
+                return False
+            return True
+
+        dirs[:] = [d for d in dirs if allowed(d)]
+
+        for name in files:
+            if not allowed(name):
+                continue
+            dst_path = dst_root / name.replace(old_name, new_name)
+            dprint(f"  File:      {rel_root / name} → {dst_path.relative_to(dst_dir)}")
+            jobs.append((root_path / name, dst_path))
+
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+        futures = [
+            pool.submit(copy_and_rename_file, src, dst, old_name, new_name)
+            for src, dst in jobs
+        ]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            # don't leave a half-scaffolded node behind
+            pool.shutdown(cancel_futures=True)
+            shutil.rmtree(dst_dir, ignore_errors=True)
+            raise
 
-        new_name_part = item.name.replace(old_name, new_name)
-        dst_path = dst_dir / new_name_part
 
-        if item.is_dir():
-            dprint(f"  Directory: {rel_path} → {new_name_part}")
-            copy_and_rename_tree(item, dst_path, old_name, new_name, blacklist)
-        else:
-            # File - copy and rename content if text-like
-            dprint(f"  File:      {rel_path} → {new_name_part}")
-            shutil.copy2(item, dst_path)
+def run_init_script(project_dir: Path, offline_first: bool = True):
+    """
+    Run init.sh in project_dir, resolving dependencies from the local caches
+    first and only going to the network if that fails.
+    """
+
+    def run(env):
+        return subprocess.run(
+            ["bash", "init.sh"],  # or ["./init.sh"] if you chmod +x it
+            cwd=project_dir,  # ← important: working directory
+            env=env,
+            check=True,  # raise exception on non-zero exit
+            text=True,
+            capture_output=True,
+        )
+
+    if offline_first:
+        try:
+            return run(dict(os.environ, **OFFLINE_ENV))
+        except subprocess.CalledProcessError as e:
+            # 126/127: init.sh couldn't run a command (e.g. uv not installed);
+            # going online won't help, so report it as is
+            if e.returncode in (126, 127):
+                raise
+            print("Offline initialization failed:")
+            if e.stderr:
+                print(e.stderr.rstrip(), file=sys.stderr)
+            print("Retrying with network access (`just prewarm` fills the caches)")
 
+    return run(dict(os.environ))
+
+
+def prewarm(templates: list[str]) -> int:
+    """
+    Fill the uv / cargo / go caches for each template by scaffolding a
+    throwaway copy and running its init.sh online.
+    """
+    if not templates:
+        templates = sorted(p.name for p in Path(TEMPLATES_DIRECTORY).iterdir())
+
+    failed = 0
+    for template in templates:
+        src = (Path(TEMPLATES_DIRECTORY) / template).resolve()
+        if not (src / "init.sh").is_file():
+            dprint(f"  {template}: no init.sh, nothing to prewarm")
+            continue
+
+        start = time.perf_counter()
+        with tempfile.TemporaryDirectory() as tmp:
+            dst = Path(tmp) / "prewarm_node"
+            copy_and_rename_tree(src, dst, src.name, dst.name, DEFAULT_BLACKLIST)
             try:
-                content = dst_path.read_text(encoding="utf-8")
-                new_content = rename_content(content, old_name, new_name)
-                if new_content != content:
-                    dst_path.write_text(new_content, encoding="utf-8")
-                    dprint(f"     ↳ content updated")
-            except (UnicodeDecodeError, PermissionError):
-                # Binary file or can't read → just keep the copy
-                pass
+                run_init_script(dst, offline_first=False)
+            except (subprocess.CalledProcessError, FileNotFoundError) as e:
+                print(f"✗ {template}: prewarm failed ({e})")
+                failed += 1
+                continue
+
+        print(f"✓ {template}: cache warm ({time.perf_counter() - start:.1f}s)")
+
+    return 1 if failed else 0
 
 
 def main():
@@ -82,9 +222,12 @@ def main():
     parser.add_argument(
         "template_dir",
         type=str,
+        nargs="?",
         help="Path to the template directory (folder named TEMPLATE_NAME)",
     )
-    parser.add_argument("new_name", type=str, help="New project/module name")
+    parser.add_argument(
+        "new_name", type=str, nargs="?", help="New project/module name"
+    )
     parser.add_argument(
         "--blacklist",
         nargs="*",
@@ -92,8 +235,22 @@ def main():
         help="Files/folders to skip (relative paths or names), e.g. .git node_modules venv",
     )
 
+    parser.add_argument(
+        "--prewarm",
+        nargs="*",
+        metavar="TEMPLATE",
+        help="Fill the dependency caches for the given templates (default: all) "
+        "so new nodes can be created offline",
+    )
+
     args = parser.parse_args()
 
+    if args.prewarm is not None:
+        return prewarm(args.prewarm)
+
+    if args.template_dir is None or args.new_name is None:
+        parser.error("template_dir and new_name are required")
+
     src = (Path(TEMPLATES_DIRECTORY) / args.template_dir).resolve()
     old_name = src.name
 
@@ -117,35 +274,14 @@ def main():
     print(f"  Destination   : {dst}")
     print()
 
-    blacklist = set(args.blacklist)
-
-    # Very common items you almost always want to skip
-    default_blacklist = {
-        ".git",
-        "node_modules",
-        "venv",
-        ".venv",
-        "__pycache__",
-        "*.pyc",
-        "dist",
-        "build",
-        ".pytest_cache",
-        ".coverage",
-        ".mypy_cache",
-        ".ruff_cache",
-        ".idea",
-        ".vscode",
-        ".DS_Store",
-        "*.lock",
-    }
-
-    blacklist = blacklist | default_blacklist
+    blacklist = set(args.blacklist) | DEFAULT_BLACKLIST
 
     dprint("Blacklist:")
     for item in sorted(blacklist):
         dprint(f"  - {item}")
     dprint()
 
+    start = time.perf_counter()
     copy_and_rename_tree(src, dst, old_name, args.new_name, blacklist)
 
     # ────────────────────────────────────────────────────────────────
@@ -159,14 +295,7 @@ def main():
         print("─" * 60)
 
         try:
-            # Run in the new directory
-            result = subprocess.run(
-                ["bash", "init.sh"],  # or ["./init.sh"] if you chmod +x it
-                cwd=dst,  # ← important: working directory
-                check=True,  # raise exception on non-zero exit
-                text=True,
-                capture_output=True,
-            )
+            result = run_init_script(dst)
 
             print(result.stdout)
             if result.stderr:
@@ -195,7 +324,7 @@ def main():
     else:
         print("No init.sh found in new project — skipping initialization step")
 
-    print("\nDone.")
+    print(f"\nDone in {time.perf_counter() - start:.2f}s.")
     print(f"New project created at: {dst}")
 
     return 0
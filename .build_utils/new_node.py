@@ -388,6 +388,17 @@ def create_python_node(node_name: str):
     print("  uv run main       # Run the node")
 
 
+def fetch_dependencies(command: list[str], node_dir: str):
+    """
+    Install dependencies from the shared local cache (no network) and only
+    fall back to a full fetch when something is missing from it.
+    """
+    offline = subprocess.run(command + ["--offline"], cwd=node_dir)
+    if offline.returncode != 0:
+        print("Dependency cache is cold — fetching from the network")
+        subprocess.run(command, cwd=node_dir)
+
+
 def main():
     if len(sys.argv) not in [2, 3]:
         print("Usage: ./new_node.py <node_name> [rust|python]")
@@ -406,10 +417,10 @@ def main():
 
     if node_type == "rust":
         create_rust_node(node_name)
-        subprocess.run(["cargo", "fetch"], cwd=node_name)
+        fetch_dependencies(["cargo", "fetch"], node_name)
     elif node_type == "python":
         create_python_node(node_name)
-        subprocess.run(["uv", "sync"], cwd=node_name)
+        fetch_dependencies(["uv", "sync", "--compile-bytecode"], node_name)
 
     subprocess.run(["direnv", "allow"], cwd=node_name)
 
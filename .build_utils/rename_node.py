@@ -1,51 +1,175 @@
 #!/usr/bin/env nix-shell
 #! nix-shell -i python3 -p python3 git
 
+"""
+Renames a node across the workspace.
+Replaces <prev> with <target> in every tracked or untracked (not ignored)
+text file, then renames files/directories whose names contain <prev>.
+Content search trusts git's ignore rules, and neither pass descends into
+.git or the .venv, target and node_modules trees. If any step fails,
+every change made so far is rolled back.
+"""
+
+import argparse
+import difflib
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-if len(sys.argv) != 3:
-    print(f"Usage: {sys.argv[0]} <prev> <target>")
-    sys.exit(1)
+# Dependency/build trees never searched or renamed, even when they aren't
+# git-ignored; anything else (e.g. tracked sources under build/) is handled
+PRUNE_DIRS = {".git", ".venv", "target", "node_modules"}
+
+# Bytes read when sniffing whether a file is binary
+SNIFF_BYTES = 8192
+
+WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def is_pruned(rel_path: str) -> bool:
+    return any(part in PRUNE_DIRS for part in Path(rel_path).parts[:-1])
+
+
+def read_candidate(path: Path, prev: str) -> str | None:
+    """Return the file's text if it is a text file containing prev"""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+
+    # cheap byte-level checks before paying for a decode
+    if b"\0" in data[:SNIFF_BYTES] or prev.encode() not in data:
+        return None
+
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def build_content_index(root: Path, prev: str) -> dict[Path, str]:
+    """Map every text file that mentions prev to its current content"""
+    # Get all tracked and untracked (but not ignored) files.
+    files = subprocess.check_output(
+        ["git", "ls-files", "--cached", "--others", "--exclude-standard", "-z"],
+        cwd=root,
+        text=True,
+    ).split("\0")
+
+    paths = [root / f for f in files if f and not is_pruned(f)]
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        contents = pool.map(lambda p: read_candidate(p, prev), paths)
+        return {p: text for p, text in zip(paths, contents) if text is not None}
+
+
+def plan_renames(root: Path, prev: str, target: str) -> list[tuple[Path, Path]]:
+    """Paths whose names contain prev, deepest first"""
+    renames = []
+
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in PRUNE_DIRS]
 
-prev = sys.argv[1]
-target = sys.argv[2]
+        for name in dirs + files:
+            if prev in name:
+                path = Path(dirpath) / name
+                renames.append((path, path.with_name(name.replace(prev, target))))
 
-cwd = Path.cwd()
-prev_dir = cwd / prev
-target_dir = cwd / target
+    renames.sort(key=lambda r: len(r[0].parts), reverse=True)
+    return renames
 
-# Get all tracked and untracked (but not ignored) files.
-files = subprocess.check_output(
-    ["git", "ls-files", "--cached", "--others", "--exclude-standard"],
-    text=True,
-).splitlines()
 
-for rel_path in files:
-    path = cwd / rel_path
+def print_plan(
+    root: Path,
+    index: dict[Path, str],
+    renames: list[tuple[Path, Path]],
+    prev: str,
+    target: str,
+):
+    for path, text in sorted(index.items()):
+        rel = path.relative_to(root)
+        sys.stdout.writelines(
+            difflib.unified_diff(
+                text.splitlines(keepends=True),
+                text.replace(prev, target).splitlines(keepends=True),
+                fromfile=f"a/{rel}",
+                tofile=f"b/{rel}",
+            )
+        )
+
+    for src, dst in renames:
+        print(f"rename: {src.relative_to(root)} -> {dst.relative_to(root)}")
+
+
+def apply(
+    root: Path,
+    index: dict[Path, str],
+    renames: list[tuple[Path, Path]],
+    prev: str,
+    target: str,
+):
+    """Apply edits and renames, undoing all of them if anything fails"""
+    written: list[Path] = []
+    renamed: list[tuple[Path, Path]] = []
+
+    def rewrite(path: Path):
+        written.append(path)
+        path.write_bytes(index[path].replace(prev, target).encode("utf-8"))
 
     try:
-        text = path.read_text()
-    except (UnicodeDecodeError, OSError):
-        # Skip binary files
-        continue
-
-    if prev in text:
-        path.write_text(text.replace(prev, target))
-        print(f"updated: {rel_path}")
-
-# Rename files/directories whose names contain prev
-for path in sorted(cwd.rglob("*"), key=lambda p: len(p.parts), reverse=True):
-    if ".git" in path.parts:
-        continue
-
-    if prev in path.name:
-        new_path = path.with_name(path.name.replace(prev, target))
-        path.rename(new_path)
-        print(f"renamed: {path} -> {new_path}")
-
-# Rename top-level directory if requested
-if prev_dir.exists():
-    prev_dir.rename(target_dir)
-    print(f"renamed: {prev_dir} -> {target_dir}")
+        with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+            # list() re-raises the first failure
+            list(pool.map(rewrite, index))
+
+        # printed here, not from the workers, so lines don't interleave
+        for path in index:
+            print(f"updated: {path.relative_to(root)}")
+
+        for src, dst in renames:
+            if dst.exists():
+                raise FileExistsError(f"{dst} already exists")
+            src.rename(dst)
+            renamed.append((src, dst))
+            print(f"renamed: {src} -> {dst}")
+
+    except Exception as e:
+        print(f"✗ Error: {e} — rolling back")
+
+        for src, dst in reversed(renamed):
+            dst.rename(src)
+        for path in written:
+            path.write_bytes(index[path].encode("utf-8"))
+
+        print("✓ Workspace restored")
+        return 1
+
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rename a node across the workspace")
+    parser.add_argument("prev", help="Current name")
+    parser.add_argument("target", help="New name")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print a diff of the content edits and the planned renames",
+    )
+
+    args = parser.parse_args()
+    root = Path.cwd()
+
+    index = build_content_index(root, args.prev)
+    renames = plan_renames(root, args.prev, args.target)
+
+    if args.dry_run:
+        print_plan(root, index, renames, args.prev, args.target)
+        return 0
+
+    return apply(root, index, renames, args.prev, args.target)
+
+
+if __name__ == "__main__":
+    exit(main())
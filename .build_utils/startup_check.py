@@ -0,0 +1,183 @@
+#!/usr/bin/env nix-shell
+#! nix-shell -i python3 -p python3
+
+"""
+Cold-start budget check for Python nodes.
+Launches a node several times with BROS_STARTUP_REPORT=1, reads the
+time-to-session-open / time-to-first-publish it reports on stderr and
+exits non-zero when the median goes over the budget.
+
+A Zenoh router must be reachable (run zenohd, or pass --router).
+
+Examples:
+  ./startup_check.py --budget-ms 80 -- python_demo
+  ./startup_check.py --importtime python_demo --python .venv/bin/python
+"""
+
+import argparse
+import os
+import queue
+import shutil
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+REPORT_PREFIX = "BROS_STARTUP"
+
+
+def parse_report(line: str) -> dict[str, float]:
+    """Parse 'BROS_STARTUP session_open_ms=1.00 first_publish_ms=2.00'."""
+    fields = {}
+    for part in line.split()[1:]:
+        key, _, value = part.partition("=")
+        if key.endswith("_ms"):
+            fields[key[: -len("_ms")]] = float(value)
+    return fields
+
+
+def run_once(command: list[str], timeout: float) -> dict[str, float] | None:
+    """Start the node, wait for its startup report, then stop it."""
+    # no pre-publish wait: measure start-up, not the subscriber timeout
+    env = dict(os.environ, BROS_STARTUP_REPORT="1", BROS_SUBSCRIBER_WAIT="0")
+    env["BROS_LAUNCH_NS"] = str(time.time_ns())
+
+    proc = subprocess.Popen(
+        command,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    reports: queue.Queue = queue.Queue()
+
+    def read_stderr():
+        # a node can hang before writing anything (e.g. stuck in zenoh.open),
+        # so stderr is read on a thread and the deadline enforced below
+        assert proc.stderr is not None
+        for line in proc.stderr:
+            if line.startswith(REPORT_PREFIX):
+                reports.put(parse_report(line))
+                return
+        reports.put(None)
+
+    reader = threading.Thread(target=read_stderr, daemon=True)
+    reader.start()
+
+    try:
+        report = reports.get(timeout=timeout)
+    except queue.Empty:
+        report = None
+    finally:
+        proc.kill()
+        proc.wait()
+        # bounded: a grandchild may still hold stderr open
+        reader.join(timeout=1.0)
+
+    return report
+
+
+def print_importtime(module: str, python: str, top: int):
+    """Print the slowest imports of `module` using `-X importtime`."""
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        return 1
+
+    rows = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+
+    rows.sort(reverse=True)
+    print(f"Slowest imports for {module} (cumulative / self, ms):")
+    for cumulative_us, self_us, name in rows[:top]:
+        print(f"  {cumulative_us / 1000:8.2f}  {self_us / 1000:8.2f}  {name}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check a node's cold-start time")
+    parser.add_argument("command", nargs="*", help="Node command, e.g. python_demo")
+    parser.add_argument("--budget-ms", type=float, default=100.0)
+    parser.add_argument(
+        "--metric",
+        choices=["first_publish", "session_open"],
+        default="first_publish",
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per run, seconds")
+    parser.add_argument(
+        "--router",
+        action="store_true",
+        help="Spawn zenohd (with $ROUTER_CONFIG if set) for the duration of the check",
+    )
+    parser.add_argument("--importtime", metavar="MODULE", help="Profile imports only")
+    parser.add_argument("--python", default=sys.executable)
+    parser.add_argument("--top", type=int, default=15)
+
+    args = parser.parse_args()
+
+    if args.importtime:
+        return print_importtime(args.importtime, args.python, args.top)
+
+    if not args.command:
+        parser.error("a node command is required")
+
+    router = None
+    if args.router:
+        if shutil.which("zenohd") is None:
+            print("✗ Error: zenohd not found on PATH")
+            return 1
+        router_cmd = ["zenohd"]
+        if os.environ.get("ROUTER_CONFIG"):
+            router_cmd += ["-c", os.environ["ROUTER_CONFIG"]]
+        router = subprocess.Popen(
+            router_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        time.sleep(0.5)
+
+    samples = []
+    try:
+        for i in range(args.runs):
+            report = run_once(args.command, args.timeout)
+            if report is None or args.metric not in report:
+                print(f"  run {i + 1}: no startup report")
+                continue
+            samples.append(report[args.metric])
+            fields = "  ".join(f"{k}={v:.2f}ms" for k, v in report.items())
+            print(f"  run {i + 1}: {fields}")
+    finally:
+        if router is not None:
+            router.terminate()
+            router.wait()
+
+    if not samples:
+        print("✗ No run produced a startup report")
+        return 1
+
+    median = statistics.median(samples)
+    print(
+        f"{args.metric}: median {median:.2f}ms, "
+        f"min {min(samples):.2f}ms, max {max(samples):.2f}ms "
+        f"(budget {args.budget_ms:.0f}ms)"
+    )
+
+    if median > args.budget_ms:
+        print("✗ Cold start over budget")
+        return 1
+
+    print("✓ Cold start within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -1 +1 @@
-uv sync
+uv sync --compile-bytecode
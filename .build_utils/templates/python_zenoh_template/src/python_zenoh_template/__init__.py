@@ -1,25 +1,35 @@
-import os
-import sys
-from time import sleep
-
-import zenoh
+from . import startup
 
 
 def main():
+    # imported here so that loading the package (entry point resolution,
+    # `-X importtime` profiling) doesn't pay for the native extension
+    import zenoh
+
+    from .qos import QosProfiles
+
     try:
-        session = zenoh.open(zenoh.Config().from_env())
+        config = zenoh.Config().from_env()
     except zenoh.ZError:
-        session = zenoh.open(zenoh.Config())
+        config = zenoh.Config()
+    # qos/publication in ZENOH_CONFIG is enforced by zenoh itself
+    qos = QosProfiles.load()
+
+    session = zenoh.open(config)
+    startup.mark("session_open")
 
-    pub = session.declare_publisher("python/helloworld")
+    # priority / congestion control / express / reliability from BROS_QOS
+    pub = qos.declare_publisher(session, "python/helloworld")
 
     sub = session.declare_subscriber("rust/helloworld")
 
-    # Wait for subscribers to be ready
-    sleep(0.5)
+    # Optionally wait for subscribers to be ready (BROS_SUBSCRIBER_WAIT;
+    # returns early once one matches)
+    startup.wait_for_subscribers(pub, timeout=startup.subscriber_wait())
 
     # Now publish
     pub.put("Hello, from Python!")
+    startup.mark("first_publish")
     print("Python → Published")
     print("Python → Waiting for Rust message...")
 
@@ -55,6 +55,20 @@
               mode: "client",
               connect: {
                 endpoints: ["tcp/127.0.0.1:7447"]
+              },
+              // Per-key publisher QoS, enforced by zenoh for every
+              // publisher of a session opened with this config
+              qos: {
+                publication: [
+                  {
+                    key_exprs: ["demo/control/**"],
+                    config: { priority: "real_time", congestion_control: "block", express: true }
+                  },
+                  {
+                    key_exprs: ["demo/telemetry/**"],
+                    config: { priority: "data_low", congestion_control: "drop", reliability: "best_effort" }
+                  }
+                ]
               }
             }
           '';
@@ -92,6 +106,9 @@
               text = ''
                 export ZENOH_CONFIG=${sharedConfig}
                 export ROUTER_CONFIG=${routerCfg}
+                # nodes start together, so let Python nodes wait for peers
+                # before their first publish
+                export BROS_SUBSCRIBER_WAIT=0.5
                 echo "Launching with shared config: $ZENOH_CONFIG"
 
                 PIDS=()
@@ -0,0 +1,170 @@
+"""
+Mixed-load QoS benchmark.
+
+Measures one-way latency of a low-rate control topic in three phases:
+  idle     - control traffic only
+  default  - a bulk publisher saturating the link, both topics on Zenoh's
+             default QoS
+  profiles - the same bulk load, with the QoS profiles below applied
+             (control: real_time/block/express, bulk: data_low/drop)
+
+The bulk publisher and its sink run in their own processes; control
+publisher and subscriber use separate sessions in this process so both
+ends share one monotonic clock. Run against a local router:
+    zenohd &
+    uv run python bench/qos_mixed_load.py
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import statistics
+import struct
+import time
+
+CONTROL_KEY = "bench/control/ping"
+BULK_KEY = "bench/telemetry/bulk"
+
+PROFILES = [
+    {
+        "key_exprs": ["bench/control/**"],
+        "config": {
+            "priority": "real_time",
+            "congestion_control": "block",
+            "express": True,
+        },
+    },
+    {
+        "key_exprs": ["bench/telemetry/**"],
+        "config": {
+            "priority": "data_low",
+            "congestion_control": "drop",
+            "reliability": "best_effort",
+        },
+    },
+]
+
+STAMP = struct.Struct(">q")
+
+
+def make_config(connect: str):
+    import zenoh
+
+    config = zenoh.Config()
+    config.insert_json5("mode", json.dumps("client"))
+    config.insert_json5("connect/endpoints", json.dumps([connect]))
+    return config
+
+
+def bulk_publisher(connect, size, use_profiles, ready, stop):
+    import zenoh
+
+    from python_demo.qos import QosProfiles
+
+    qos = QosProfiles(PROFILES if use_profiles else [])
+    payload = bytes(size)
+
+    with zenoh.open(make_config(connect)) as session:
+        pub = qos.declare_publisher(session, BULK_KEY)
+        ready.set()
+        while not stop.is_set():
+            pub.put(payload)
+
+
+def bulk_sink(connect, ready, stop):
+    import zenoh
+
+    with zenoh.open(make_config(connect)) as session:
+        sub = session.declare_subscriber(BULK_KEY, lambda sample: None)
+        ready.set()
+        stop.wait()
+        sub.undeclare()
+
+
+def control_latencies(connect, use_profiles, count, interval):
+    import zenoh
+
+    from python_demo.qos import QosProfiles
+    from python_demo.startup import wait_for_subscribers
+
+    qos = QosProfiles(PROFILES if use_profiles else [])
+    latencies = []
+
+    def on_sample(sample):
+        sent = STAMP.unpack(bytes(sample.payload))[0]
+        latencies.append((time.perf_counter_ns() - sent) / 1000)
+
+    with zenoh.open(make_config(connect)) as sub_session, zenoh.open(
+        make_config(connect)
+    ) as pub_session:
+        sub = sub_session.declare_subscriber(CONTROL_KEY, on_sample)
+        pub = qos.declare_publisher(pub_session, CONTROL_KEY)
+        wait_for_subscribers(pub, timeout=5.0)
+
+        for _ in range(count):
+            pub.put(STAMP.pack(time.perf_counter_ns()))
+            time.sleep(interval)
+        time.sleep(0.5)
+        sub.undeclare()
+
+    return latencies
+
+
+def run_phase(name, args, bulk: bool, use_profiles: bool):
+    ctx = mp.get_context("spawn")
+    stop = ctx.Event()
+    procs = []
+
+    if bulk:
+        sink_ready, pub_ready = ctx.Event(), ctx.Event()
+        procs = [
+            ctx.Process(target=bulk_sink, args=(args.connect, sink_ready, stop)),
+            ctx.Process(
+                target=bulk_publisher,
+                args=(args.connect, args.bulk_size, use_profiles, pub_ready, stop),
+            ),
+        ]
+        procs[0].start()
+        sink_ready.wait(10)
+        procs[1].start()
+        pub_ready.wait(10)
+        time.sleep(1.0)  # let the bulk stream fill the link
+
+    try:
+        lat = control_latencies(args.connect, use_profiles, args.count, args.interval)
+    finally:
+        stop.set()
+        for p in procs:
+            p.join(10)
+            if p.is_alive():
+                p.terminate()
+
+    if not lat:
+        print(f"{name:>9}  no control samples received")
+        return
+
+    lat.sort()
+    p99 = lat[min(len(lat) - 1, int(len(lat) * 0.99))]
+    print(
+        f"{name:>9} {len(lat):>6}/{args.count:<6} "
+        f"{statistics.median(lat):>9.0f} {p99:>9.0f} {lat[-1]:>9.0f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mixed-load QoS benchmark")
+    parser.add_argument("--connect", default="tcp/127.0.0.1:7447")
+    parser.add_argument("--count", type=int, default=2000, help="Control messages")
+    parser.add_argument("--interval", type=float, default=0.001, help="Seconds")
+    parser.add_argument("--bulk-size", type=int, default=64 * 1024, help="Bytes")
+
+    args = parser.parse_args()
+
+    print(f"{'phase':>9} {'received':>13} {'p50 us':>9} {'p99 us':>9} {'max us':>9}")
+    run_phase("idle", args, bulk=False, use_profiles=False)
+    run_phase("default", args, bulk=True, use_profiles=False)
+    run_phase("profiles", args, bulk=True, use_profiles=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Scaling benchmark for sharded topics.
+
+For K = 1 .. --max-shards, starts K publisher processes (each with its own
+Zenoh session) that push --messages in total over the shards of one logical
+topic, while this process merges the shards back with a ShardedSubscriber.
+Reports the aggregate publish rate and the merged delivery rate. The
+merging subscriber is a single process, so once the publishers outrun it
+the delivery rate flattens while the publish rate keeps scaling.
+
+Run against a local router on a multi-core Linux box:
+    zenohd &
+    uv run python bench/shard_scaling.py --max-shards 8
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import time
+
+TOPIC = "bench/shards"
+
+
+def make_config(connect: str | None):
+    import zenoh
+
+    if os.environ.get("ZENOH_CONFIG"):
+        config = zenoh.Config.from_env()
+    else:
+        config = zenoh.Config()
+    if connect:
+        config.insert_json5("mode", json.dumps("client"))
+        config.insert_json5("connect/endpoints", json.dumps([connect]))
+    return config
+
+
+def publisher_worker(shard, shards, count, size, connect, barrier, results):
+    import zenoh
+
+    from python_demo.shard import ShardedPublisher
+    from python_demo.startup import wait_for_subscribers
+
+    payload = bytes(size)
+
+    with zenoh.open(make_config(connect)) as session:
+        pub = ShardedPublisher(session, TOPIC, shard, shards)
+        wait_for_subscribers(pub.publisher, timeout=5.0)
+        barrier.wait()
+
+        start = time.perf_counter()
+        for _ in range(count):
+            pub.put(payload)
+        results.put((shard, count, time.perf_counter() - start))
+
+
+def run(shards, messages, size, connect, reorder_window, timeout):
+    import zenoh
+
+    from python_demo.shard import ShardedSubscriber
+
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(shards + 1)
+    results = ctx.Queue()
+    per_shard = messages // shards
+
+    with zenoh.open(make_config(connect)) as session:
+        sub = ShardedSubscriber(session, TOPIC, reorder_window=reorder_window)
+
+        workers = [
+            ctx.Process(
+                target=publisher_worker,
+                args=(i, shards, per_shard, size, connect, barrier, results),
+            )
+            for i in range(shards)
+        ]
+        for w in workers:
+            w.start()
+
+        barrier.wait(timeout)
+        start = time.perf_counter()
+        deadline = start + timeout
+        expected = per_shard * shards
+        received = 0
+
+        while received < expected and time.perf_counter() < deadline:
+            if sub.try_recv() is not None:
+                received += 1
+        received += len(sub.flush())
+        elapsed = time.perf_counter() - start
+
+        # drain results before joining: a worker blocked flushing its queue
+        # would never exit
+        timings = [results.get(timeout=timeout) for _ in workers]
+        for w in workers:
+            w.join()
+        sub.undeclare()
+
+    publish_rate = sum(count / secs for _, count, secs in timings)
+    return publish_rate, received, expected, received / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sharded topic scaling benchmark")
+    parser.add_argument("--max-shards", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--size", type=int, default=64, help="Payload bytes")
+    parser.add_argument("--connect", default="tcp/127.0.0.1:7447")
+    parser.add_argument(
+        "--reorder-window",
+        type=int,
+        default=None,
+        help="Merge in sequence order with this reorder buffer size",
+    )
+    parser.add_argument("--timeout", type=float, default=30.0)
+
+    args = parser.parse_args()
+
+    print(f"{'shards':>6} {'publish msg/s':>14} {'delivered msg/s':>16} {'delivered':>12}")
+    for shards in range(1, args.max_shards + 1):
+        publish_rate, received, expected, delivered_rate = run(
+            shards,
+            args.messages,
+            args.size,
+            args.connect,
+            args.reorder_window,
+            args.timeout,
+        )
+        print(
+            f"{shards:>6} {publish_rate:>14,.0f} {delivered_rate:>16,.0f} "
+            f"{received:>6}/{expected:<6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
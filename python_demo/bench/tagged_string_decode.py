@@ -0,0 +1,114 @@
+"""
+Decode benchmark for repetitive TaggedString traffic.
+
+Generates a stream where `s` is mostly drawn from a small Zipf-distributed
+set of status/mode words, `id` from a few dozen node ids, and a small
+fraction of messages carry unique free-form text. Decodes it with the plain
+TaggedString.from_msgpack and with a TaggedStringDecoder, reporting CPU time
+and the memory held by the decoded messages.
+
+    uv run python bench/tagged_string_decode.py --messages 200000
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from python_demo.tagged_string import TaggedString, TaggedStringDecoder
+
+WORDS = [
+    "ok",
+    "idle",
+    "armed",
+    "disarmed",
+    "takeoff",
+    "landing",
+    "hover",
+    "mission",
+    "return_to_launch",
+    "manual",
+    "stabilize",
+    "offboard",
+    "low_battery",
+    "gps_fix",
+    "gps_lost",
+    "link_ok",
+    "link_degraded",
+    "heartbeat",
+    "calibrating",
+    "ready",
+    "error",
+    "warning",
+    "standby",
+    "shutdown",
+]
+
+
+def make_stream(count: int, ids: int, unique_ratio: float, seed: int) -> list[bytes]:
+    rng = random.Random(seed)
+    # Zipf-like weights: a few words dominate
+    weights = [1 / (rank + 1) ** 1.2 for rank in range(len(WORDS))]
+    id_weights = [1 / (rank + 1) for rank in range(ids)]
+
+    payloads = []
+    for i in range(count):
+        if rng.random() < unique_ratio:
+            s = f"log line {i}: value={rng.random():.6f}"
+        else:
+            # build a fresh str so the sender side doesn't share objects
+            s = "".join(rng.choices(WORDS, weights)[0])
+        node_id = rng.choices(range(ids), id_weights)[0]
+        payloads.append(TaggedString(id=node_id, s=s).to_msgpack())
+    return payloads
+
+
+def measure(decode, payloads: list[bytes]):
+    """CPU seconds to decode the stream, and bytes held by the results."""
+    gc.collect()
+    start = time.process_time()
+    for data in payloads:
+        decode(data)
+    cpu = time.process_time() - start
+
+    gc.collect()
+    tracemalloc.start()
+    kept = [decode(data) for data in payloads]
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return cpu, held
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TaggedString decode benchmark")
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--ids", type=int, default=32, help="Distinct node ids")
+    parser.add_argument("--unique", type=float, default=0.05, help="Unique text ratio")
+    parser.add_argument("--intern-size", type=int, default=256)
+    parser.add_argument("--memo-size", type=int, default=1024)
+    parser.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args()
+
+    payloads = make_stream(args.messages, args.ids, args.unique, args.seed)
+
+    plain_cpu, plain_mem = measure(TaggedString.from_msgpack, payloads)
+    decoder = TaggedStringDecoder(args.intern_size, args.memo_size)
+    cached_cpu, cached_mem = measure(decoder.decode, payloads)
+
+    n = len(payloads)
+    print(f"{n} messages, {len(set(payloads))} distinct payloads")
+    print(f"{'':>10} {'us/msg':>8} {'held MiB':>9}")
+    print(f"{'plain':>10} {plain_cpu / n * 1e6:>8.2f} {plain_mem / 2**20:>9.1f}")
+    print(f"{'cached':>10} {cached_cpu / n * 1e6:>8.2f} {cached_mem / 2**20:>9.1f}")
+    print(
+        f"CPU {100 * (1 - cached_cpu / plain_cpu):.0f}% less, "
+        f"memory {100 * (1 - cached_mem / plain_mem):.0f}% less"
+    )
+    print(decoder.stats())
+
+
+if __name__ == "__main__":
+    main()
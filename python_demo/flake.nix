@@ -35,6 +35,15 @@
       editableOverlay = workspace.mkEditablePyprojectOverlay {
         root = "$REPO_ROOT";
       };
+      # Precompile the node's own modules so a cold start never has to
+      # write .pyc files (the store is read-only, so it couldn't cache them).
+      bytecodeOverlay = final: prev: {
+        python_demo = prev.python_demo.overrideAttrs (old: {
+          postInstall = (old.postInstall or "") + ''
+            ${final.python.interpreter} -m compileall -q -j 0 $out/${final.python.sitePackages}
+          '';
+        });
+      };
       pythonSets = forAllSystems (
         system:
         let
@@ -48,6 +57,7 @@
             lib.composeManyExtensions [
               pyproject-build-systems.overlays.wheel
               overlay
+              bytecodeOverlay
             ]
           )
       );
@@ -68,6 +78,7 @@
             ];
             env = {
               UV_NO_SYNC = "1";
+              UV_COMPILE_BYTECODE = "1";
               UV_PYTHON = pythonSet.python.interpreter;
               UV_PYTHON_DOWNLOADS = "never";
             };
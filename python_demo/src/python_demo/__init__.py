@@ -1,19 +1,35 @@
 import time
 
-import zenoh
-
-from .tagged_string import TaggedString
+from . import startup
 
 
 def main():
-    with zenoh.open(zenoh.Config()) as session:
-        publisher = session.declare_publisher("demo/out/py")
+    # imported here so that loading the package (entry point resolution,
+    # `-X importtime` profiling) doesn't pay for zenoh and msgpack
+    import zenoh
+
+    from .qos import QosProfiles
+    from .tagged_string import TaggedString
+
+    try:
+        config = zenoh.Config.from_env()
+    except zenoh.ZError:
+        config = zenoh.Config()
+    # qos/publication in ZENOH_CONFIG is enforced by zenoh itself
+    qos = QosProfiles.load()
+
+    with zenoh.open(config) as session:
+        startup.mark("session_open")
+        publisher = qos.declare_publisher(session, "demo/out/py")
+
+        # optionally wait for remote subscribers before declaring our own,
+        # otherwise the local subscriber on demo/out/* would match immediately
+        startup.wait_for_subscribers(publisher, timeout=startup.subscriber_wait())
         subscriber = session.declare_subscriber("demo/out/*")
 
-        time.sleep(0.5)
-
         msg = TaggedString(id=67, s="hello from python!")
         publisher.put(msg.to_msgpack())
+        startup.mark("first_publish")
         print(f"Python Sent: {msg}")
 
         deadline = time.time() + 6
@@ -0,0 +1,76 @@
+"""
+Per-key QoS profiles applied when publishers are declared.
+
+Profiles use the schema of the `qos/publication` section of a Zenoh config
+(priority, congestion_control, express, reliability per key expression).
+There are two places to put them:
+
+- the flake-generated ZENOH_CONFIG. Zenoh (>= 1.1) enforces these itself
+  for every publisher of the session, so nothing here reads them, and
+  they take precedence over anything passed to declare_publisher.
+- a node-level JSON file (a list of the same entries) pointed to by
+  BROS_QOS, for nodes that don't own their Zenoh config. These are
+  matched here; the first entry whose key expressions include the
+  publisher's key wins:
+
+    [
+      {"key_exprs": ["demo/control/**"],
+       "config": {"priority": "real_time", "congestion_control": "block", "express": true}},
+      {"key_exprs": ["demo/telemetry/**"],
+       "config": {"priority": "data_low", "congestion_control": "drop"}}
+    ]
+"""
+
+import json
+import os
+
+import zenoh
+
+# config value -> zenoh enum used by declare_publisher
+_ENUMS = {
+    "priority": zenoh.Priority,
+    "congestion_control": zenoh.CongestionControl,
+    "reliability": zenoh.Reliability,
+}
+
+
+def _option(name: str, value):
+    if name == "express":
+        return bool(value)
+    return getattr(_ENUMS[name], str(value).upper())
+
+
+class QosProfiles:
+    def __init__(self, entries: list[dict] | None = None):
+        self.rules: list[tuple[list[zenoh.KeyExpr], dict]] = []
+
+        for entry in entries or []:
+            key_exprs = [zenoh.KeyExpr(k) for k in entry.get("key_exprs", [])]
+            options = {
+                name: _option(name, value)
+                for name, value in entry.get("config", {}).items()
+                if name in _ENUMS or name == "express"
+            }
+            self.rules.append((key_exprs, options))
+
+    @classmethod
+    def load(cls) -> "QosProfiles":
+        """Profiles from the BROS_QOS file, if one is set."""
+        path = os.environ.get("BROS_QOS")
+        if not path:
+            return cls()
+
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def options(self, key: str) -> dict:
+        """declare_publisher keyword arguments for key."""
+        ke = zenoh.KeyExpr(key)
+        for key_exprs, options in self.rules:
+            if any(rule.includes(ke) for rule in key_exprs):
+                return dict(options)
+        return {}
+
+    def declare_publisher(self, session, key: str, **overrides):
+        """Declare a publisher on key with its profile; explicit kwargs win."""
+        return session.declare_publisher(key, **(self.options(key) | overrides))
@@ -0,0 +1,169 @@
+"""
+Sharded topics: one logical topic spread over K key suffixes.
+
+A logical topic such as `demo/out/py` is published as `demo/out/py/shard0`
+... `demo/out/py/shard{K-1}`, typically by K worker processes each with its
+own session, so publishing isn't bound by a single interpreter. Every
+message carries a global sequence number in its attachment (shard i sends
+i, i + K, i + 2K, ...), which lets a subscriber merge the shards back into
+one stream and optionally release it in sequence order with a reorder
+buffer.
+
+Sequence order is round-robin order over the shards, not the order in which
+messages were published: it matches publish order only while every shard
+publishes at the same rate.
+"""
+
+import heapq
+import itertools
+import struct
+from collections import deque
+
+SEQ = struct.Struct(">Q")
+
+
+def shard_key(topic: str, shard: int) -> str:
+    return f"{topic}/shard{shard}"
+
+
+def shards_selector(topic: str) -> str:
+    """Key expression matching every shard of topic."""
+    return f"{topic}/*"
+
+
+class ShardedPublisher:
+    """Publishes shard `shard` of `shards` for a logical topic."""
+
+    def __init__(self, session, topic: str, shard: int, shards: int, **options):
+        if not 0 <= shard < shards:
+            raise ValueError(f"shard {shard} out of range for {shards} shards")
+
+        self.key = shard_key(topic, shard)
+        self.publisher = session.declare_publisher(self.key, **options)
+        self._next_seq = shard
+        self._stride = shards
+
+    def put(self, payload) -> int:
+        """Publish payload and return the sequence number it was sent with."""
+        seq = self._next_seq
+        self.publisher.put(payload, attachment=SEQ.pack(seq))
+        self._next_seq += self._stride
+        return seq
+
+    def undeclare(self):
+        self.publisher.undeclare()
+
+
+def sample_seq(sample) -> int | None:
+    """Sequence number of a sharded sample, or None if it has none."""
+    attachment = sample.attachment
+    if attachment is None:
+        return None
+    data = bytes(attachment)
+    if len(data) != SEQ.size:
+        return None
+    return SEQ.unpack(data)[0]
+
+
+class ReorderBuffer:
+    """
+    Releases items in sequence order. Items that arrive early are held
+    until the gap before them fills; if more than `window` items are held,
+    the gap is given up on and delivery skips ahead. A duplicate of a held
+    sequence number is dropped.
+
+    With sharded topics, sequence order is round-robin order across shards.
+    If one shard publishes faster than another, its items fill the window,
+    the buffer skips past the slow shard's sequence numbers, and the slow
+    shard's samples are then passed through late and out of order.
+    """
+
+    def __init__(self, window: int = 1024, start: int = 0):
+        self.window = window
+        self.next_seq = start
+        self.skipped = 0
+        self._heap: list[tuple[int, int, object]] = []
+        self._held: set[int] = set()
+        self._tiebreak = itertools.count()
+
+    def push(self, seq: int, item) -> list:
+        """Add an item and return the items now ready, in order."""
+        if seq < self.next_seq:
+            # late arrival after its gap was skipped: deliver as-is
+            return [item]
+        if seq in self._held:
+            return []
+
+        self._held.add(seq)
+        heapq.heappush(self._heap, (seq, next(self._tiebreak), item))
+        ready = self._drain()
+
+        while len(self._heap) > self.window:
+            seq = self._heap[0][0]
+            self.skipped += seq - self.next_seq
+            self.next_seq = seq
+            ready += self._drain()
+
+        return ready
+
+    def flush(self) -> list:
+        """Release everything still held, in order."""
+        held = sorted(self._heap)
+        self._heap.clear()
+        self._held.clear()
+        if held:
+            # continue after the last released item, not at the old gap
+            last = held[-1][0]
+            self.skipped += last + 1 - self.next_seq - len(held)
+            self.next_seq = last + 1
+        return [item for _, _, item in held]
+
+    def _drain(self) -> list:
+        ready = []
+        while self._heap and self._heap[0][0] == self.next_seq:
+            seq, _, item = heapq.heappop(self._heap)
+            self._held.discard(seq)
+            ready.append(item)
+            self.next_seq += 1
+        return ready
+
+
+class ShardedSubscriber:
+    """
+    Merges every shard of a logical topic into one stream.
+
+    `reorder_window=None` delivers samples in arrival order; otherwise
+    samples are released in sequence order through a ReorderBuffer.
+    """
+
+    def __init__(self, session, topic: str, reorder_window: int | None = None):
+        self.subscriber = session.declare_subscriber(shards_selector(topic))
+        self.reorder = (
+            ReorderBuffer(reorder_window) if reorder_window is not None else None
+        )
+        self._ready: deque = deque()
+
+    def try_recv(self):
+        """Next merged sample, or None if nothing is ready."""
+        while not self._ready:
+            sample = self.subscriber.try_recv()
+            if sample is None:
+                return None
+
+            seq = sample_seq(sample)
+            if self.reorder is None or seq is None:
+                return sample
+            self._ready.extend(self.reorder.push(seq, sample))
+
+        return self._ready.popleft()
+
+    def flush(self) -> list:
+        """Samples still held by the reorder buffer, in order."""
+        ready = list(self._ready)
+        self._ready.clear()
+        if self.reorder is not None:
+            ready += self.reorder.flush()
+        return ready
+
+    def undeclare(self):
+        self.subscriber.undeclare()
@@ -0,0 +1,86 @@
+"""
+Cold-start instrumentation for Python nodes.
+
+Set BROS_STARTUP_REPORT=1 to print time-to-session-open and
+time-to-first-publish on stderr. A launcher can export BROS_LAUNCH_NS
+(time.time_ns() taken just before spawning the node) so the numbers include
+interpreter start-up; otherwise they are measured from the first import of
+this module.
+
+Only the standard library is imported here so that it stays cheap to load.
+"""
+
+import os
+import sys
+import time
+
+REPORT_PREFIX = "BROS_STARTUP"
+
+_IMPORTED_NS = time.time_ns()
+_marks: dict[str, int] = {}
+
+
+def _origin_ns() -> int:
+    try:
+        return int(os.environ["BROS_LAUNCH_NS"])
+    except (KeyError, ValueError):
+        return _IMPORTED_NS
+
+
+def mark(name: str) -> None:
+    """Record the first occurrence of a startup milestone."""
+    if name in _marks:
+        return
+    _marks[name] = time.time_ns()
+
+    if name == "first_publish":
+        report()
+
+
+def elapsed_ms() -> dict[str, float]:
+    """Milliseconds from the origin to each recorded milestone."""
+    origin = _origin_ns()
+    return {name: (ns - origin) / 1e6 for name, ns in _marks.items()}
+
+
+def report() -> None:
+    """Print the recorded milestones if BROS_STARTUP_REPORT is set."""
+    if os.environ.get("BROS_STARTUP_REPORT", "") in ("", "0"):
+        return
+    fields = " ".join(f"{name}_ms={ms:.2f}" for name, ms in elapsed_ms().items())
+    print(f"{REPORT_PREFIX} {fields}", file=sys.stderr, flush=True)
+
+
+def subscriber_wait() -> float:
+    """
+    Seconds to wait for a matching subscriber before the first publish, from
+    BROS_SUBSCRIBER_WAIT. Off by default so a restarted node publishes
+    straight away; launchers that start several nodes at once opt in.
+    """
+    try:
+        return max(0.0, float(os.environ.get("BROS_SUBSCRIBER_WAIT", "0")))
+    except ValueError:
+        return 0.0
+
+
+def wait_for_subscribers(publisher, timeout: float = 0.5, interval: float = 0.005):
+    """
+    Block until the publisher has at least one matching subscriber, or until
+    `timeout` seconds have passed. Replaces a fixed sleep before the first put
+    so a restarted node publishes as soon as its peers are reachable.
+    """
+    deadline = time.monotonic() + timeout
+
+    while True:
+        try:
+            if publisher.matching_status.matching:
+                return True
+        except AttributeError:
+            # zenoh build without the matching API: fall back to a plain wait
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            return False
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
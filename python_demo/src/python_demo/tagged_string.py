@@ -1,9 +1,10 @@
+from collections import OrderedDict
 from dataclasses import dataclass
 
 import msgpack
 
 
-@dataclass
+@dataclass(slots=True)
 class TaggedString:
     id: int
     s: str
@@ -17,3 +18,92 @@ class TaggedString:
     def from_msgpack(cls, data: bytes) -> "TaggedString":
         vals = msgpack.unpackb(data)
         return cls(id=vals[0], s=vals[1])
+
+
+class TaggedStringDecoder:
+    """
+    Decoder for repetitive TaggedString traffic.
+
+    Keeps a bounded LRU intern table for the `s` field, so equal strings
+    decode to one shared object, and a bounded memo of recently seen
+    payloads, so an identical message skips the msgpack parse entirely.
+    Either cache can be disabled by giving it a size of 0.
+
+    A string enters the intern table only the second time it is seen, so a
+    stream of one-off text can't evict the recurring ones. Every decode
+    returns a new TaggedString, so callers may modify it; a memo hit only
+    reuses the parsed fields.
+    """
+
+    def __init__(
+        self, intern_size: int = 256, memo_size: int = 1024, max_memo_payload: int = 256
+    ):
+        self.intern_size = intern_size
+        self.memo_size = memo_size
+        # larger payloads are unlikely to repeat and costly to keep around
+        self.max_memo_payload = max_memo_payload
+
+        self._interned: OrderedDict[str, str] = OrderedDict()
+        # strings seen once, admitted to _interned on their next sighting
+        self._candidates: OrderedDict[str, None] = OrderedDict()
+        self._memo: OrderedDict[bytes, tuple[int, str]] = OrderedDict()
+
+        self.intern_hits = 0
+        self.intern_misses = 0
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+    def decode(self, data: bytes) -> TaggedString:
+        memoize = self.memo_size > 0 and len(data) <= self.max_memo_payload
+
+        if memoize:
+            if type(data) is not bytes:
+                # memoryview / bytearray payloads aren't hashable
+                data = bytes(data)
+            fields = self._memo.get(data)
+            if fields is not None:
+                self._memo.move_to_end(data)
+                self.memo_hits += 1
+                return TaggedString(*fields)
+            self.memo_misses += 1
+
+        vals = msgpack.unpackb(data)
+        fields = (vals[0], self.intern(vals[1]))
+
+        if memoize:
+            self._memo[data] = fields
+            if len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+        return TaggedString(*fields)
+
+    def intern(self, s: str) -> str:
+        """Return the shared copy of s, interning it if it was seen before."""
+        if self.intern_size <= 0:
+            return s
+
+        shared = self._interned.get(s)
+        if shared is not None:
+            self._interned.move_to_end(s)
+            self.intern_hits += 1
+            return shared
+
+        self.intern_misses += 1
+        if s in self._candidates:
+            del self._candidates[s]
+            self._interned[s] = s
+            if len(self._interned) > self.intern_size:
+                self._interned.popitem(last=False)
+        else:
+            self._candidates[s] = None
+            if len(self._candidates) > self.intern_size:
+                self._candidates.popitem(last=False)
+        return s
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "intern_hits": self.intern_hits,
+            "intern_misses": self.intern_misses,
+            "memo_hits": self.memo_hits,
+            "memo_misses": self.memo_misses,
+        }
@@ -0,0 +1,62 @@
+import unittest
+
+from python_demo.shard import ReorderBuffer
+
+
+class ReorderBufferTest(unittest.TestCase):
+    def test_push_in_order(self):
+        buf = ReorderBuffer()
+        self.assertEqual(buf.push(0, "a"), ["a"])
+        self.assertEqual(buf.push(1, "b"), ["b"])
+        self.assertEqual(buf.next_seq, 2)
+
+    def test_push_holds_until_gap_fills(self):
+        buf = ReorderBuffer()
+        self.assertEqual(buf.push(2, "c"), [])
+        self.assertEqual(buf.push(1, "b"), [])
+        self.assertEqual(buf.push(0, "a"), ["a", "b", "c"])
+        self.assertEqual(buf.skipped, 0)
+
+    def test_push_drops_duplicate_of_held_seq(self):
+        buf = ReorderBuffer()
+        self.assertEqual(buf.push(5, "x"), [])
+        self.assertEqual(buf.push(5, "y"), [])
+        self.assertEqual(buf.flush(), ["x"])
+        self.assertEqual(buf.skipped, 5)
+        self.assertEqual(buf.next_seq, 6)
+
+    def test_window_overflow_skips_ahead(self):
+        buf = ReorderBuffer(window=2)
+        self.assertEqual(buf.push(1, "b"), [])
+        self.assertEqual(buf.push(2, "c"), [])
+        # a third held item overflows the window: seq 0 is given up on
+        self.assertEqual(buf.push(4, "e"), ["b", "c"])
+        self.assertEqual(buf.skipped, 1)
+        self.assertEqual(buf.next_seq, 3)
+
+    def test_late_item_after_skip_passes_through(self):
+        buf = ReorderBuffer(window=1)
+        buf.push(1, "b")
+        buf.push(2, "c")
+        self.assertEqual(buf.next_seq, 3)
+        self.assertEqual(buf.push(0, "a"), ["a"])
+
+    def test_flush_releases_held_in_order(self):
+        buf = ReorderBuffer()
+        buf.push(3, "d")
+        buf.push(1, "b")
+        self.assertEqual(buf.flush(), ["b", "d"])
+        self.assertEqual(buf.skipped, 2)
+        self.assertEqual(buf.next_seq, 4)
+        self.assertEqual(buf.flush(), [])
+
+    def test_push_after_flush_continues(self):
+        buf = ReorderBuffer()
+        buf.push(2, "c")
+        buf.flush()
+        self.assertEqual(buf.push(3, "d"), ["d"])
+        self.assertEqual(buf.push(1, "b"), ["b"])
+
+
+if __name__ == "__main__":
+    unittest.main()